@@ -7,12 +7,19 @@ Runs the interactive scraper with option to enable scheduling
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Add src folder to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from event_scraper import EventScraper
+# All Excel output goes here; created once at import
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'output')
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+CITIES = ('Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Pune', 'Kolkata', 'Chennai')
+# Lowercase city code -> display name
+CITY_LOOKUP = {city.lower(): city for city in CITIES}
 
 
 def print_header():
@@ -25,23 +32,29 @@ def print_header():
 
 def run_interactive():
     """Run interactive scraper"""
+    # Imported here so the menu and help don't pay for pandas/scraper imports
+    from event_scraper import EventScraper
+    
     print_header()
     
     print("Available cities:")
-    cities = ['Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Pune', 'Kolkata', 'Chennai']
-    for i, city in enumerate(cities, 1):
+    for i, city in enumerate(CITIES, 1):
         print(f"  {i}. {city}")
     
-    choice = input("\nSelect city (1-7) or enter city name: ").strip()
+    choice = input(f"\nSelect city (1-{len(CITIES)}) or enter city name: ").strip()
     
-    if choice.isdigit() and 1 <= int(choice) <= len(cities):
-        city = cities[int(choice) - 1]
+    n = int(choice) if choice.isdigit() else -1
+    if 1 <= n <= len(CITIES):
+        city = CITIES[n - 1]
     else:
-        city = choice if choice else 'Mumbai'
+        city = CITY_LOOKUP.get(choice.lower(), choice or 'Mumbai')
+    
+    run_start = datetime.now()
+    run_date_str = run_start.strftime('%Y%m%d')
     
     print(f"\n{'='*70}")
     print(f"Scraping events for: {city}")
-    print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Start time: {run_start.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*70}\n")
     
     # Create scraper and scrape events
@@ -59,14 +72,8 @@ def run_interactive():
     
     print(f"\nTotal events found: {len(events)}")
     
-    # Create output folder if needed
-    output_dir = os.path.join(os.path.dirname(__file__), 'output')
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Created output directory: {output_dir}")
-    
     # Save to Excel
-    filename = os.path.join(output_dir, f"events_{city.lower()}_{datetime.now().strftime('%Y%m%d')}.xlsx")
+    filename = os.path.join(OUTPUT_DIR, f"events_{city.lower()}_{run_date_str}.xlsx")
     scraper.save_to_excel(events, filename)
     
     print(f"\n{'='*70}")
@@ -75,62 +82,125 @@ def run_interactive():
     print(f"{'='*70}\n")
 
 
+def _scrape_one(city_code, city_name):
+    """
+    Scrape a single city
+
+    Args:
+        city_code: Lowercase city key understood by EventScraper
+        city_name: Display name used for progress output
+
+    Returns:
+        Tuple of (city_name, events, elapsed_seconds)
+    """
+    from event_scraper import EventScraper
+    
+    print(f"\n[{city_name}] Starting scrape...")
+    start = time.time()
+    
+    scraper = EventScraper(city=city_code, use_sheets=False)
+    events = scraper.scrape_bookmyshow()
+    
+    if not events:
+        events = scraper.scrape_bookmyshow_browser()
+    
+    return city_name, events, time.time() - start
+
+
 def run_all_cities():
-    """Scrape all cities in sequence"""
+    """Scrape all cities concurrently and save them to one workbook"""
+    from event_scraper import EventScraper
+    
     print_header()
     
-    cities_map = {
-        'mumbai': 'Mumbai',
-        'delhi': 'Delhi',
-        'bangalore': 'Bangalore',
-        'hyderabad': 'Hyderabad',
-        'pune': 'Pune',
-        'kolkata': 'Kolkata',
-        'chennai': 'Chennai'
-    }
-    
-    print(f"Scraping all cities: {', '.join(cities_map.values())}")
-    print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    # Fixed once so a run that crosses midnight is saved under its start date
+    run_start = datetime.now()
+    run_date_str = run_start.strftime('%Y%m%d')
+    
+    print(f"Scraping all cities: {', '.join(CITY_LOOKUP.values())}")
+    print(f"Start time: {run_start.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70 + "\n")
     
-    total_events = 0
+    results = {}
     
-    for city_code, city_name in cities_map.items():
-        try:
-            print(f"\n[{city_name}] Starting scrape...")
-            start = time.time()
-            
-            scraper = EventScraper(city=city_code, use_sheets=False)
-            events = scraper.scrape_bookmyshow()
-            
-            if not events:
-                events = scraper.scrape_bookmyshow_browser()
-            
-            # Create output folder
-            output_dir = os.path.join(os.path.dirname(__file__), 'output')
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            filename = os.path.join(output_dir, f"events_{city_code}_{datetime.now().strftime('%Y%m%d')}.xlsx")
-            scraper.save_to_excel(events, filename)
-            
-            elapsed = time.time() - start
-            total_events += len(events)
-            
-            print(f"[{city_name}] ✅ Completed in {elapsed:.1f}s - Found {len(events)} events")
-            
-            time.sleep(1)  # Brief pause between cities
-            
-        except Exception as e:
-            print(f"[{city_name}] ❌ Error: {str(e)}")
+    # Each city is dominated by network waits, so threads overlap them well
+    with ThreadPoolExecutor(max_workers=len(CITY_LOOKUP)) as executor:
+        futures = {
+            executor.submit(_scrape_one, city_code, city_name): city_name
+            for city_code, city_name in CITY_LOOKUP.items()
+        }
+        
+        for future in as_completed(futures):
+            city_name = futures[future]
+            try:
+                _, events, elapsed = future.result()
+                results[city_name] = events
+                print(f"[{city_name}] ✅ Completed in {elapsed:.1f}s - Found {len(events)} events")
+            except Exception as e:
+                print(f"[{city_name}] ❌ Error: {str(e)}")
+    
+    # Workers finish in any order; lay the sheets out in CITIES order so the
+    # workbook looks the same from run to run
+    events_by_city = {name: results[name] for name in CITIES if name in results}
+    
+    # One workbook with a sheet per city instead of seven separate files
+    filename = os.path.join(OUTPUT_DIR, f"events_all_{run_date_str}.xlsx")
+    saved = True
+    try:
+        counts_by_city = EventScraper.save_multi_to_excel(events_by_city, filename)
+    except Exception as e:
+        # Still report what was scraped even though the workbook couldn't be written
+        print(f"❌ Error saving {filename}: {str(e)}")
+        saved = False
+        counts_by_city = {
+            city_name: EventScraper.count_statuses(events)
+            for city_name, events in events_by_city.items()
+        }
+    
+    total_events = 0
+    for city_name, status_counts in counts_by_city.items():
+        total_events += sum(status_counts.values())
+        breakdown = ', '.join(f"{status} {n}" for status, n in status_counts.items())
+        print(f"[{city_name}] {breakdown}")
     
     print(f"\n{'='*70}")
     print(f"✅ All cities processed!")
     print(f"Total events collected: {total_events}")
+    if saved:
+        print(f"✅ Data saved to: {filename}")
     print(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*70}\n")
 
 
+def _confirm_all_cities():
+    """Ask before running the full all-cities scrape"""
+    confirm = input(f"\nThis will scrape all {len(CITIES)} cities. Continue? (y/n): ").strip().lower()
+    if confirm == 'y':
+        run_all_cities()
+
+
+def _print_scheduler_hint():
+    """Explain how to start the automated scheduler"""
+    print("\n" + "=" * 70)
+    print("To run the scheduler, use:")
+    print("  python scripts/scheduler.py")
+    print("\nThis will run automated scraping at:")
+    print("  • Daily at 9:00 AM for Mumbai, Delhi, Bangalore")
+    print("  • Every 6 hours for Mumbai")
+    print("=" * 70 + "\n")
+
+
+def _exit():
+    """Leave the tool"""
+    print("\nExiting... Goodbye! 👋\n")
+    sys.exit(0)
+
+
+def _invalid_option():
+    """Report an unknown menu choice"""
+    print("\n❌ Invalid option. Please try again.\n")
+
+
 def show_menu():
     """Show main menu"""
     print_header()
@@ -144,27 +214,7 @@ def show_menu():
     
     choice = input("\nSelect option (1-5): ").strip()
     
-    if choice == '1':
-        run_interactive()
-    elif choice == '2':
-        confirm = input("\nThis will scrape all 7 cities. Continue? (y/n): ").strip().lower()
-        if confirm == 'y':
-            run_all_cities()
-    elif choice == '3':
-        print("\n" + "=" * 70)
-        print("To run the scheduler, use:")
-        print("  python scripts/scheduler.py")
-        print("\nThis will run automated scraping at:")
-        print("  • Daily at 9:00 AM for Mumbai, Delhi, Bangalore")
-        print("  • Every 6 hours for Mumbai")
-        print("=" * 70 + "\n")
-    elif choice == '4':
-        show_help()
-    elif choice == '5':
-        print("\nExiting... Goodbye! 👋\n")
-        sys.exit(0)
-    else:
-        print("\n❌ Invalid option. Please try again.\n")
+    MENU_HANDLERS.get(choice, _invalid_option)()
 
 
 def show_help():
@@ -208,6 +258,16 @@ For more details, see: ARCHITECTURE.md
     input("Press Enter to continue...")
 
 
+# Menu choice -> handler; unknown choices fall through to _invalid_option
+MENU_HANDLERS = {
+    '1': run_interactive,
+    '2': _confirm_all_cities,
+    '3': _print_scheduler_hint,
+    '4': show_help,
+    '5': _exit,
+}
+
+
 def main():
     """Main entry point"""
     try:
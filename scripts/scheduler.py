@@ -4,29 +4,69 @@ Runs the event scraper at regular intervals
 """
 
 from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import sys
 import os
+import threading
 
 # Add src folder to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from event_scraper import EventScraper
+# Configure logging: job threads only enqueue records, and a background
+# listener does the file/console I/O so concurrent jobs don't contend on it
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('event_scraper.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
 
-# Configure logging
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue side only carries the bare message; the listener's handlers
+# apply the real format, so it isn't prefixed twice
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('event_scraper.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
+# All Excel output goes here; created once at import
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'output')
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Scrapers are kept alive between runs so their HTTP sessions keep connections warm
+_scrapers = {}
+_scrapers_lock = threading.Lock()
+
+
+def get_scraper(city: str):
+    """
+    Return the shared scraper for a city, creating it on first use
+    
+    Args:
+        city: City to scrape
+    """
+    # Deferred so importing the scheduler doesn't pull in the scraper's dependencies
+    from event_scraper import EventScraper
+    
+    with _scrapers_lock:
+        if city not in _scrapers:
+            _scrapers[city] = EventScraper(city=city, use_sheets=False)
+        return _scrapers[city]
+
 
 def scrape_job(city: str = 'mumbai'):
     """
@@ -36,20 +76,16 @@ def scrape_job(city: str = 'mumbai'):
         city: City to scrape
     """
     try:
+        run_date_str = datetime.now().strftime('%Y%m%d')
         logger.info(f"Starting scrape job for {city}")
         
-        scraper = EventScraper(city=city, use_sheets=False)
+        scraper = get_scraper(city)
         events = scraper.scrape_bookmyshow()
         
         logger.info(f"Found {len(events)} events")
         
-        # Create output folder if needed
-        output_dir = os.path.join(os.path.dirname(__file__), '..', 'output')
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
         # Save to Excel
-        filename = os.path.join(output_dir, f"events_{city}_{datetime.now().strftime('%Y%m%d')}.xlsx")
+        filename = os.path.join(OUTPUT_DIR, f"events_{city}_{run_date_str}.xlsx")
         scraper.save_to_excel(events, filename)
         
         logger.info(f"Data saved to {filename}")
@@ -61,33 +97,32 @@ def scrape_job(city: str = 'mumbai'):
 
 def main():
     """Main scheduler function"""
-    scheduler = BlockingScheduler()
+    # Schedule configurations: cron hours per city. Mumbai (high-volume city)
+    # folds its 6-hourly runs into the same job as the daily 9 AM sweep
+    schedules = {
+        'mumbai': '0,6,9,12,18',
+        'delhi': '9',
+        'bangalore': '9'
+    }
     
-    # Schedule configurations
-    cities = ['mumbai', 'delhi', 'bangalore']
+    # One worker per city so the 9 AM jobs start together instead of queueing;
+    # a single instance per job keeps two runs from writing the same file, and
+    # late runs within the grace window collapse into one
+    scheduler = BlockingScheduler(
+        executors={'default': ThreadPoolExecutor(max_workers=len(schedules))},
+        job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 600}
+    )
     
-    # Run daily at 9 AM for each city
-    for city in cities:
+    for city, hours in schedules.items():
         scheduler.add_job(
             scrape_job,
-            CronTrigger(hour=9, minute=0),
+            CronTrigger(hour=hours, minute=0),
             args=[city],
             id=f'scrape_{city}',
             name=f'Scrape events for {city}',
             replace_existing=True
         )
-        logger.info(f"Scheduled daily scrape for {city} at 9:00 AM")
-    
-    # Also run every 6 hours for Mumbai (high-volume city)
-    scheduler.add_job(
-        scrape_job,
-        CronTrigger(hour='*/6'),
-        args=['mumbai'],
-        id='scrape_mumbai_frequent',
-        name='Frequent scrape for Mumbai',
-        replace_existing=True
-    )
-    logger.info("Scheduled 6-hourly scrape for Mumbai")
+        logger.info(f"Scheduled scrape for {city} at hours {hours}")
     
     logger.info("Scheduler started. Press Ctrl+C to exit.")
     
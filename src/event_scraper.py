@@ -6,17 +6,21 @@ Scrapes event data from BookMyShow and stores in Google Sheets
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import time
-import json
+import functools
+import hashlib
+import random
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
-from openpyxl import load_workbook
+from openpyxl import Workbook
 import os
+import threading
 
 # Try to import curl_cffi for better anti-bot handling
 try:
@@ -25,6 +29,170 @@ try:
 except ImportError:
     HAS_CURL_CFFI = False
 
+# selectolax (Lexbor) handles the anchor scan in C; BeautifulSoup is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# lxml is a C parser and much faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = 'lxml'
+except ImportError:
+    BS4_PARSER = 'html.parser'
+
+# xlsxwriter streams rows to disk; pandas' default writer is used without it
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+# Keep-alive connections held per host by the requests session; override via env
+POOL_MAXSIZE = int(os.environ.get('BMS_POOL_MAXSIZE', '8'))
+
+# Every city lives on in.bookmyshow.com, so concurrent scrapers share one
+# gate instead of each sleeping between requests
+MAX_CONCURRENT_REQUESTS = 4
+_HOST_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Tries made with each anti-bot client (curl_cffi, cloudscraper) before falling back
+FALLBACK_ATTEMPTS = 2
+
+
+class JitteredRetry(Retry):
+    """Retry that sleeps a random time up to the exponential backoff ("full jitter")"""
+    
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
+# Patterns used inside the per-card loops, compiled once at import
+_EVENT_HREF_RE = re.compile(r'/events/[^/]+/ET\d+')
+_EVENT_NAME_RE = re.compile(r'/events/([^/]+)/')
+# Landing-page text accepts short d/m dates; rendered cards need a year
+_DATE_RE = re.compile(r"\d{1,2}\s+[A-Za-z]{3,9}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}")
+_CARD_DATE_RE = re.compile(r"\d{1,2}\s+[A-Za-z]{3,9}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}")
+_DIGIT_RE = re.compile(r"\d{1,2}")
+_LINK_CONTAINERS = SoupStrainer(['a', 'div', 'article'])
+_TITLE_CLASS_RE = re.compile('title|name|heading')
+_DATE_CLASS_RE = re.compile('date|time')
+_VENUE_CLASS_RE = re.compile('venue|location|place')
+
+
+# Columns of every event record, in the order they are written out
+EVENT_COLUMNS = [
+    'event_name', 'event_date', 'venue', 'city', 'category', 'url',
+    'platform', 'status', 'last_updated', 'event_id'
+]
+
+# Date formats recognised when classifying an event as Active/Upcoming/Expired
+DATE_FORMATS = ['%Y-%m-%d', '%d %b %Y', '%d/%m/%Y', '%b %d, %Y']
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_event_date(event_date: str) -> Optional[datetime]:
+    """
+    Parse an event date string; memoized on the string alone so the cache
+    stays useful across batches
+    
+    Args:
+        event_date: Event date string
+        
+    Returns:
+        Parsed datetime, or None if no DATE_FORMATS entry matches
+    """
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(event_date, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _classify_status(event_date: str, today: datetime) -> str:
+    """
+    Classify an event date relative to today
+    
+    Args:
+        event_date: Event date string
+        today: Reference time
+        
+    Returns:
+        Status: Active, Expired, or Upcoming
+    """
+    try:
+        event_dt = _parse_event_date(event_date)
+    except TypeError:
+        # NaN or other non-string values from a spreadsheet
+        event_dt = None
+    
+    # If date parsing fails, default to Active
+    if event_dt is None:
+        return 'Active'
+    if event_dt < today:
+        return 'Expired'
+    elif event_dt <= today + timedelta(days=7):
+        return 'Active'
+    else:
+        return 'Upcoming'
+
+
+def _status_series(event_dates: pd.Series, today: datetime) -> pd.Series:
+    """
+    Vectorized _classify_status over a whole column
+    
+    Args:
+        event_dates: Event date strings
+        today: Reference time
+        
+    Returns:
+        Status per row: Active, Expired, or Upcoming
+    """
+    # Historical rows repeat a handful of dates, so classify each distinct
+    # string once and broadcast back through the factorized codes
+    codes, uniques = pd.factorize(event_dates.astype(str))
+    dates = pd.Series(uniques)
+    
+    # One C-level parse per format; the first format that matches wins
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+    for fmt in DATE_FORMATS:
+        parsed = parsed.fillna(pd.to_datetime(dates, format=fmt, errors='coerce'))
+    
+    status = np.select(
+        [parsed.isna(), parsed < today, parsed <= today + timedelta(days=7)],
+        ['Active', 'Expired', 'Active'],
+        default='Upcoming'
+    )
+    return pd.Series(status[codes], index=event_dates.index)
+
+
+# Card selectors for browser-rendered pages, tried in order until one matches
+_CARD_SELECTORS = [
+    "div[class*='card']",
+    "article",
+    "a[class*='__event']",
+    "div[class*='EventCard']",
+]
+
+# Runs in the page: returns [{text, href}] for the first selector with matches
+_EXTRACT_CARDS_JS = """
+(args) => {
+    for (const sel of args.selectors) {
+        const cards = document.querySelectorAll(sel);
+        if (cards.length) {
+            return Array.from(cards).slice(0, args.limit).map(card => {
+                const link = card.querySelector('a[href]');
+                return {text: card.innerText || '', href: link ? link.href : ''};
+            });
+        }
+    }
+    return [];
+}
+"""
+
 
 class EventScraper:
     """Main class for scraping and managing event data"""
@@ -39,6 +207,15 @@ class EventScraper:
         'chennai': 'chennai'
     }
     
+    # Seconds a page's parsed event links are reused before refetching. Kept
+    # clear of the scheduler's 3-hour Mumbai gaps so a run either always or
+    # never reuses the previous one, regardless of how long the fetch took
+    LINKS_CACHE_TTL = 4 * 60 * 60
+    
+    # chromedriver path from webdriver-manager, shared by every scraper instance
+    _chromedriver_path = None
+    _chromedriver_lock = threading.Lock()
+    
     def __init__(self, city: str = 'mumbai', use_sheets: bool = False):
         """
         Initialize scraper
@@ -48,6 +225,7 @@ class EventScraper:
             use_sheets: Whether to use Google Sheets (True) or Excel (False)
         """
         self.city = city.lower()
+        self.city_name = self.city.capitalize()
         self.city_code = self.CITIES.get(self.city, 'mumbai')
         self.use_sheets = use_sheets
         # More complete headers to mimic a real browser
@@ -65,18 +243,25 @@ class EventScraper:
         # Use a session with retries
         self.session = requests.Session()
         self.session.headers.update(self.headers)
-        retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retries)
+        retries = JitteredRetry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=POOL_MAXSIZE, pool_block=True)
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
 
-        # cloudscraper will be used as a fallback if available to bypass simple anti-bot checks
-        self._cloudscraper_available = False
+        # url -> (fetched_at, event links); lives as long as the scraper instance
+        self._links_cache = {}
+
+        # curl_cffi session is created once so its connections are kept alive
+        self._cffi_session = cffi_requests.Session(impersonate="chrome120") if HAS_CURL_CFFI else None
+
+        # cloudscraper will be used as a fallback if available to bypass simple anti-bot checks;
+        # built once on top of self.session so it shares the same cookies and headers
+        self._cf_scraper = None
         try:
             import cloudscraper  # type: ignore
-            self._cloudscraper_available = True
+            self._cf_scraper = cloudscraper.create_scraper(sess=self.session)
         except Exception:
-            self._cloudscraper_available = False
+            self._cf_scraper = None
         
     def scrape_bookmyshow(self) -> List[Dict]:
         """
@@ -90,39 +275,36 @@ class EventScraper:
         # BookMyShow actual URL pattern for events in a city
         url = f"https://in.bookmyshow.com/explore/events-{self.city_code}"
         
+        # Every event in this batch shares one timestamp
+        scraped_at = datetime.now()
+        last_updated = scraped_at.strftime('%Y-%m-%d %H:%M:%S')
+        
         try:
             print(f"Trying {url}...")
-            response = self._get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for event links with the pattern /events/event-name/ET00...
-            event_links = soup.find_all('a', href=re.compile(r'/events/[^/]+/ET\d+'))
+            event_links = self._get_event_links(url, timeout=15)
             
             print(f"Found {len(event_links)} event links")
             
-            for link in event_links[:30]:  # Limit to 30 events
+            for href, text in event_links[:30]:  # Limit to 30 events
                 try:
-                    href = link.get('href', '')
                     if href and href.startswith('/'):
                         href = f"https://in.bookmyshow.com{href}"
                     
                     # Extract event name from href
-                    match = re.search(r'/events/([^/]+)/', href)
+                    match = _EVENT_NAME_RE.search(href)
                     event_name = match.group(1).replace('-', ' ').title() if match else 'Unknown Event'
                     
-                    # Try to get more details from the link's parent container
-                    parent = link.find_parent(['div', 'article'])
                     date = 'TBD'
                     venue = 'Various Venues'
                     category = 'General'
                     
-                    if parent:
-                        text = parent.get_text(strip=True)
+                    # Try to get more details from the link's parent container
+                    if text:
                         lines = [l.strip() for l in text.splitlines() if l.strip()]
                         
                         # Try to extract date from text (look for patterns like "15 Feb" or dates)
                         for line in lines:
-                            if re.search(r"\d{1,2}\s+[A-Za-z]{3,9}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}", line):
+                            if _DATE_RE.search(line):
                                 date = line
                                 break
                     
@@ -130,17 +312,16 @@ class EventScraper:
                         'event_name': event_name,
                         'event_date': date,
                         'venue': venue,
-                        'city': self.city.capitalize(),
+                        'city': self.city_name,
                         'category': category,
                         'url': href,
                         'platform': 'BookMyShow',
-                        'status': self._determine_status(date),
-                        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        'status': self._determine_status(date, scraped_at),
+                        'last_updated': last_updated,
                         'event_id': self._generate_event_id(event_name, date, venue)
                     }
                     
                     events.append(event)
-                    time.sleep(0.3)  # Small delay between processing
                     
                 except Exception as e:
                     continue
@@ -148,7 +329,44 @@ class EventScraper:
         except Exception as e:
             print(f"Error scraping BookMyShow: {str(e)}")
             
-        return events
+        return self._dedup(events)
+
+    def _extract_event_links(self, content: bytes) -> List[Tuple[str, Optional[str]]]:
+        """
+        Find event anchors on a listing page
+        
+        Args:
+            content: Raw page HTML
+            
+        Returns:
+            List of (href, text of the nearest div/article container or None)
+        """
+        links = []
+        
+        if HAS_SELECTOLAX:
+            tree = LexborHTMLParser(content.decode('utf-8', 'replace'))
+            for node in tree.css('a[href*="/events/"]'):
+                href = node.attributes.get('href') or ''
+                if not _EVENT_HREF_RE.search(href):
+                    continue
+                
+                parent = node.parent
+                while parent is not None and parent.tag not in ('div', 'article'):
+                    parent = parent.parent
+                
+                text = parent.text(separator='\n', strip=True) if parent is not None else None
+                links.append((href, text))
+            return links
+        
+        # Look for event links with the pattern /events/event-name/ET00...
+        # Only build anchors and the containers the heuristics read from;
+        # <head>, top-level scripts/styles and the like are skipped by the parser
+        soup = BeautifulSoup(content, BS4_PARSER, parse_only=_LINK_CONTAINERS)
+        for link in soup.find_all('a', href=_EVENT_HREF_RE):
+            parent = link.find_parent(['div', 'article'])
+            text = parent.get_text('\n', strip=True) if parent else None
+            links.append((link.get('href', ''), text))
+        return links
 
     def scrape_bookmyshow_browser(self, max_events: int = 50) -> List[Dict]:
         """
@@ -165,6 +383,8 @@ class EventScraper:
             return events
 
         base_url = f"https://in.bookmyshow.com/{self.city_code}"
+        scraped_at = datetime.now()
+        last_updated = scraped_at.strftime('%Y-%m-%d %H:%M:%S')
 
         try:
             with sync_playwright() as p:
@@ -176,65 +396,13 @@ class EventScraper:
                 page.goto(base_url, wait_until='networkidle', timeout=30000)
 
                 # Try to click or navigate to the events section if present
-                # Many BookMyShow pages render event sections inside the landing page
-                # We'll look for event card selectors and extract data
-                selectors = [
-                    "div[class*='card']",
-                    "article",
-                    "a[class*='__event']",
-                    "div[class*='EventCard']",
-                ]
-
-                found_cards = []
-                for sel in selectors:
-                    try:
-                        cards = page.query_selector_all(sel)
-                        if cards:
-                            found_cards = cards
-                            break
-                    except Exception:
-                        continue
+                # Many BookMyShow pages render event sections inside the landing page.
+                # Cards are read in one evaluate() call rather than a round-trip per card
+                cards = page.evaluate(_EXTRACT_CARDS_JS, {'selectors': _CARD_SELECTORS, 'limit': max_events})
 
-                for card in found_cards[:max_events]:
+                for card in cards:
                     try:
-                        # Extract text content and link
-                        text = card.inner_text()
-                        link_el = card.query_selector('a[href]')
-                        href = link_el.get_attribute('href') if link_el else ''
-                        if href and not href.startswith('http'):
-                            href = f"https://in.bookmyshow.com{href}"
-
-                        # Heuristics to pick name/date/venue from the text blob
-                        lines = [l.strip() for l in text.splitlines() if l.strip()]
-                        name = lines[0] if lines else 'Unknown Event'
-                        date = 'TBD'
-                        venue = 'Various Venues'
-
-                        # Find a line that looks like a date
-                        for ln in lines[1:4]:
-                            if re.search(r"\d{1,2}\s+[A-Za-z]{3,9}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}", ln):
-                                date = ln
-                                break
-
-                        for ln in lines[-3:]:
-                            if len(ln) < 60 and not re.search(r"\d{1,2}", ln):
-                                venue = ln
-                                break
-
-                        event = {
-                            'event_name': name,
-                            'event_date': date,
-                            'venue': venue,
-                            'city': self.city.capitalize(),
-                            'category': 'General',
-                            'url': href or base_url,
-                            'platform': 'BookMyShow',
-                            'status': self._determine_status(date),
-                            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'event_id': self._generate_event_id(name, date, venue)
-                        }
-
-                        events.append(event)
+                        events.append(self._parse_card_text(card['text'], card['href'], base_url, scraped_at, last_updated))
                     except Exception:
                         continue
 
@@ -247,7 +415,7 @@ class EventScraper:
         except Exception as e:
             print(f"Browser scraping failed: {str(e)}")
 
-        return events
+        return self._dedup(events)
 
     def scrape_bookmyshow_selenium(self, max_events: int = 50) -> List[Dict]:
         """
@@ -260,7 +428,6 @@ class EventScraper:
         try:
             from selenium import webdriver
             from selenium.webdriver.chrome.service import Service as ChromeService
-            from selenium.webdriver.common.by import By
             from selenium.webdriver.chrome.options import Options
             from webdriver_manager.chrome import ChromeDriverManager
         except Exception:
@@ -268,6 +435,8 @@ class EventScraper:
             return events
 
         base_url = f"https://in.bookmyshow.com/{self.city_code}"
+        scraped_at = datetime.now()
+        last_updated = scraped_at.strftime('%Y-%m-%d %H:%M:%S')
 
         try:
             options = Options()
@@ -276,7 +445,11 @@ class EventScraper:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
 
-            service = ChromeService(ChromeDriverManager().install())
+            # install() checks the network for driver updates, so resolve it once per process
+            with EventScraper._chromedriver_lock:
+                if EventScraper._chromedriver_path is None:
+                    EventScraper._chromedriver_path = ChromeDriverManager().install()
+            service = ChromeService(EventScraper._chromedriver_path)
             driver = webdriver.Chrome(service=service, options=options)
             driver.set_page_load_timeout(30)
             driver.get(base_url)
@@ -284,65 +457,15 @@ class EventScraper:
             # Allow some time for JS to render
             time.sleep(3)
 
-            selectors = [
-                "div[class*='card']",
-                "article",
-                "a[class*='__event']",
-                "div[class*='EventCard']",
-            ]
+            # Same single-call card extraction as the Playwright scraper
+            cards = driver.execute_script(
+                f"return ({_EXTRACT_CARDS_JS})(arguments[0]);",
+                {'selectors': _CARD_SELECTORS, 'limit': max_events}
+            )
 
-            found_elements = []
-            for sel in selectors:
+            for card in cards:
                 try:
-                    elems = driver.find_elements(By.CSS_SELECTOR, sel)
-                    if elems:
-                        found_elements = elems
-                        break
-                except Exception:
-                    continue
-
-            for el in found_elements[:max_events]:
-                try:
-                    text = el.text
-                    link_el = None
-                    try:
-                        link_el = el.find_element(By.CSS_SELECTOR, 'a[href]')
-                    except Exception:
-                        pass
-
-                    href = link_el.get_attribute('href') if link_el else ''
-                    if href and not href.startswith('http'):
-                        href = f"https://in.bookmyshow.com{href}"
-
-                    lines = [l.strip() for l in text.splitlines() if l.strip()]
-                    name = lines[0] if lines else 'Unknown Event'
-                    date = 'TBD'
-                    venue = 'Various Venues'
-
-                    for ln in lines[1:4]:
-                        if re.search(r"\d{1,2}\s+[A-Za-z]{3,9}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}", ln):
-                            date = ln
-                            break
-
-                    for ln in lines[-3:]:
-                        if len(ln) < 60 and not re.search(r"\d{1,2}", ln):
-                            venue = ln
-                            break
-
-                    event = {
-                        'event_name': name,
-                        'event_date': date,
-                        'venue': venue,
-                        'city': self.city.capitalize(),
-                        'category': 'General',
-                        'url': href or base_url,
-                        'platform': 'BookMyShow',
-                        'status': self._determine_status(date),
-                        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'event_id': self._generate_event_id(name, date, venue)
-                    }
-
-                    events.append(event)
+                    events.append(self._parse_card_text(card['text'], card['href'], base_url, scraped_at, last_updated))
                 except Exception:
                     continue
 
@@ -354,7 +477,55 @@ class EventScraper:
         except Exception as e:
             print(f"Selenium scraping failed: {str(e)}")
 
-        return events
+        return self._dedup(events)
+    
+    def _parse_card_text(self, text: str, href: str, base_url: str,
+                         scraped_at: datetime, last_updated: str) -> Dict:
+        """
+        Build an event from a browser-rendered card
+        
+        Args:
+            text: Visible text of the card
+            href: Card link, absolute or site-relative ('' if none)
+            base_url: Page URL used when the card has no link
+            scraped_at: Batch time used to classify the event's status
+            last_updated: scraped_at formatted for the last_updated column
+            
+        Returns:
+            Event dictionary
+        """
+        if href and not href.startswith('http'):
+            href = f"https://in.bookmyshow.com{href}"
+
+        # Heuristics to pick name/date/venue from the text blob
+        lines = [l.strip() for l in text.splitlines() if l.strip()]
+        name = lines[0] if lines else 'Unknown Event'
+        date = 'TBD'
+        venue = 'Various Venues'
+
+        # Find a line that looks like a date
+        for ln in lines[1:4]:
+            if _CARD_DATE_RE.search(ln):
+                date = ln
+                break
+
+        for ln in lines[-3:]:
+            if len(ln) < 60 and not _DIGIT_RE.search(ln):
+                venue = ln
+                break
+
+        return {
+            'event_name': name,
+            'event_date': date,
+            'venue': venue,
+            'city': self.city_name,
+            'category': 'General',
+            'url': href or base_url,
+            'platform': 'BookMyShow',
+            'status': self._determine_status(date, scraped_at),
+            'last_updated': last_updated,
+            'event_id': self._generate_event_id(name, date, venue)
+        }
     
     def _parse_event_card(self, card, category: str, platform: str) -> Optional[Dict]:
         """
@@ -370,15 +541,15 @@ class EventScraper:
         """
         try:
             # Extract event name
-            name_elem = card.find(['h2', 'h3', 'a'], class_=re.compile('title|name|heading'))
+            name_elem = card.find(['h2', 'h3', 'a'], class_=_TITLE_CLASS_RE)
             event_name = name_elem.get_text(strip=True) if name_elem else None
             
             # Extract date
-            date_elem = card.find(['span', 'div', 'time'], class_=re.compile('date|time'))
+            date_elem = card.find(['span', 'div', 'time'], class_=_DATE_CLASS_RE)
             event_date = date_elem.get_text(strip=True) if date_elem else 'TBD'
             
             # Extract venue
-            venue_elem = card.find(['span', 'div'], class_=re.compile('venue|location|place'))
+            venue_elem = card.find(['span', 'div'], class_=_VENUE_CLASS_RE)
             venue = venue_elem.get_text(strip=True) if venue_elem else 'Various Venues'
             
             # Extract URL
@@ -397,7 +568,7 @@ class EventScraper:
                 'event_name': event_name,
                 'event_date': event_date,
                 'venue': venue,
-                'city': self.city.capitalize(),
+                'city': self.city_name,
                 'category': category.replace('-', ' ').title(),
                 'url': url,
                 'platform': platform,
@@ -410,28 +581,46 @@ class EventScraper:
             print(f"Error parsing event card: {str(e)}")
             return None
 
+    def _get_event_links(self, url: str, timeout: int = 10) -> List[Tuple[str, Optional[str]]]:
+        """
+        Fetch a listing page and extract its event links, reusing links found
+        within LINKS_CACHE_TTL. Pages without links (e.g. anti-bot challenges)
+        are never cached, so the next run fetches again.
+        """
+        cached = self._links_cache.get(url)
+        if cached and time.time() - cached[0] < self.LINKS_CACHE_TTL:
+            return cached[1]
+        
+        response = self._get(url, timeout=timeout)
+        event_links = self._extract_event_links(response.content)
+        if event_links:
+            self._links_cache[url] = (time.time(), event_links)
+        return event_links
+    
     def _get(self, url: str, timeout: int = 10):
+        """
+        GET a page, holding the shared host semaphore while the request runs.
+        """
+        with _HOST_SEMAPHORE:
+            return self._fetch(url, timeout=timeout)
+    
+    def _fetch(self, url: str, timeout: int = 10):
         """
         Robust GET with curl_cffi (best anti-bot) then cloudscraper, then requests.
         """
         # Try curl_cffi first (best for anti-bot and CloudFlare)
-        if HAS_CURL_CFFI:
+        if self._cffi_session is not None:
             try:
-                resp = cffi_requests.get(url, headers=self.headers, timeout=timeout, impersonate="chrome120")
-                resp.raise_for_status()
-                return resp
+                return self._get_with_jitter(self._cffi_session, url, timeout)
             except Exception as e:
                 print(f"curl_cffi failed: {e}, trying cloudscraper...")
         
         # Try cloudscraper next
         try:
-            if self._cloudscraper_available:
-                import cloudscraper  # type: ignore
-                scraper = cloudscraper.create_scraper()
-                resp = scraper.get(url, headers=self.headers, timeout=timeout)
-            else:
-                resp = self.session.get(url, timeout=timeout)
+            if self._cf_scraper is not None:
+                return self._get_with_jitter(self._cf_scraper, url, timeout)
 
+            resp = self.session.get(url, timeout=timeout)
             resp.raise_for_status()
             return resp
         except Exception as e:
@@ -443,45 +632,69 @@ class EventScraper:
             except Exception as final_error:
                 raise final_error
     
+    def _get_with_jitter(self, client, url: str, timeout: int):
+        """
+        GET through a client without adapter retries, retrying with full-jitter backoff
+        
+        Args:
+            client: curl_cffi or cloudscraper session
+            url: URL to fetch
+            timeout: Per-attempt timeout in seconds
+        """
+        for attempt in range(FALLBACK_ATTEMPTS):
+            try:
+                resp = client.get(url, headers=self.headers, timeout=timeout)
+                resp.raise_for_status()
+                return resp
+            except Exception:
+                if attempt + 1 >= FALLBACK_ATTEMPTS:
+                    raise
+                # Full jitter so concurrent scrapers don't retry in lock-step
+                time.sleep(random.uniform(0, min(30, 2 ** attempt)))
+    
+    def _dedup(self, events: List[Dict]) -> List[Dict]:
+        """
+        Drop repeated events in a single pass, keeping the first occurrence
+        
+        Args:
+            events: List of event dictionaries
+            
+        Returns:
+            Events with unique (name, date, venue) keys
+        """
+        seen = set()
+        unique_events = []
+        
+        for event in events:
+            key = (
+                event['event_name'].strip().lower(),
+                event['event_date'],
+                event['venue'].strip().lower()
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_events.append(event)
+        
+        return unique_events
+    
     def _generate_event_id(self, name: str, date: str, venue: str) -> str:
-        """Generate unique event ID"""
+        """Generate unique event ID, stable across runs"""
         unique_string = f"{name}_{date}_{venue}_{self.city}".lower()
-        return str(hash(unique_string))[:16]
+        return hashlib.blake2b(unique_string.encode('utf-8'), digest_size=8).hexdigest()
     
-    def _determine_status(self, event_date: str) -> str:
+    def _determine_status(self, event_date: str, today: Optional[datetime] = None) -> str:
         """
         Determine event status based on date
         
         Args:
             event_date: Event date string
+            today: Reference time; defaults to now
             
         Returns:
             Status: Active, Expired, or Upcoming
         """
-        try:
-            # Parse various date formats
-            today = datetime.now()
-            
-            # Try different date formats
-            date_formats = ['%Y-%m-%d', '%d %b %Y', '%d/%m/%Y', '%b %d, %Y']
-            
-            for fmt in date_formats:
-                try:
-                    event_dt = datetime.strptime(event_date, fmt)
-                    if event_dt < today:
-                        return 'Expired'
-                    elif event_dt <= today + timedelta(days=7):
-                        return 'Active'
-                    else:
-                        return 'Upcoming'
-                except:
-                    continue
-            
-            # If date parsing fails, default to Active
-            return 'Active'
-            
-        except:
-            return 'Active'
+        return _classify_status(event_date, today or datetime.now())
     
     def save_to_excel(self, events: List[Dict], filename: str = 'events_data.xlsx'):
         """
@@ -490,34 +703,154 @@ class EventScraper:
         Args:
             events: List of event dictionaries
             filename: Output filename
+            
+        Returns:
+            Count of saved events per status (Active, Upcoming, Expired)
         """
-        df_new = pd.DataFrame(events)
+        status_counts = self.count_statuses(events)
+        
+        df_new = self._events_frame(events)
         
         if df_new.empty:
             print("No events to save")
-            return
+            return status_counts
         
         # Check if file exists
         if os.path.exists(filename):
-            # Load existing data
+            # Load existing data and merge the new batch into it
             df_existing = pd.read_excel(filename)
+            df_combined = self._merge_events(df_existing, df_new)
             
-            # Merge and deduplicate based on event_id
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            
-            # Update existing events or add new ones
-            df_combined = df_combined.sort_values('last_updated', ascending=False)
-            df_combined = df_combined.drop_duplicates(subset=['event_id'], keep='first')
-            
-            # Update status for all events
-            df_combined['status'] = df_combined['event_date'].apply(self._determine_status)
-            
-            df_combined.to_excel(filename, index=False)
+            self._write_workbook(filename, {'Sheet1': df_combined})
             print(f"Updated {len(df_combined)} events in {filename}")
         else:
             # Create new file
-            df_new.to_excel(filename, index=False)
+            self._write_workbook(filename, {'Sheet1': df_new})
             print(f"Created {filename} with {len(df_new)} events")
+        
+        return status_counts
+    
+    @staticmethod
+    def save_multi_to_excel(events_by_city: Dict[str, List[Dict]], filename: str) -> Dict[str, Dict[str, int]]:
+        """
+        Save several cities' events to one workbook, one sheet per city
+        
+        Args:
+            events_by_city: Mapping of sheet (city) name to its event dictionaries
+            filename: Output filename
+            
+        Returns:
+            Count of saved events per status, keyed by city
+        """
+        sheets = pd.read_excel(filename, sheet_name=None) if os.path.exists(filename) else {}
+        counts_by_city = {}
+        
+        for city, events in events_by_city.items():
+            counts_by_city[city] = EventScraper.count_statuses(events)
+            
+            df_new = EventScraper._events_frame(events)
+            if df_new.empty:
+                continue
+            
+            if city in sheets:
+                sheets[city] = EventScraper._merge_events(sheets[city], df_new)
+            else:
+                sheets[city] = df_new
+        
+        if not sheets:
+            print("No events to save")
+            return counts_by_city
+        
+        # Every sheet goes into a single archive write
+        EventScraper._write_workbook(filename, sheets)
+        print(f"Saved {sum(len(df) for df in sheets.values())} events across {len(sheets)} sheets in {filename}")
+        
+        return counts_by_city
+    
+    @staticmethod
+    def count_statuses(events: List[Dict]) -> Dict[str, int]:
+        """Tally events per status in a single pass"""
+        status_counts = {'Active': 0, 'Upcoming': 0, 'Expired': 0}
+        for event in events:
+            status_counts[event['status']] = status_counts.get(event['status'], 0) + 1
+        return status_counts
+    
+    @staticmethod
+    def _events_frame(events: List[Dict]) -> pd.DataFrame:
+        """
+        Build a DataFrame from event dictionaries column by column
+        
+        Args:
+            events: List of event dictionaries
+            
+        Returns:
+            DataFrame with EVENT_COLUMNS in a fixed order
+        """
+        # Gathering each column as one list lets pandas skip the row-to-column
+        # transpose and key discovery it does for a list of dicts
+        columns = {col: [event.get(col) for event in events] for col in EVENT_COLUMNS}
+        return pd.DataFrame(columns, columns=EVENT_COLUMNS, copy=False)
+    
+    @staticmethod
+    def _merge_events(df_existing: pd.DataFrame, df_new: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge a new batch into previously saved events
+        
+        Args:
+            df_existing: Events already on disk
+            df_new: Freshly scraped events
+            
+        Returns:
+            Combined events, newest first, one row per event_id
+        """
+        # Merge and deduplicate based on event_id
+        df_combined = pd.concat([df_existing, df_new], ignore_index=True)
+        
+        # Update existing events or add new ones
+        df_combined = df_combined.sort_values('last_updated', ascending=False)
+        df_combined = df_combined.drop_duplicates(subset=['event_id'], keep='first')
+        
+        # Update status for all events
+        df_combined['status'] = _status_series(df_combined['event_date'], datetime.now())
+        
+        return df_combined
+    
+    @staticmethod
+    def _write_workbook(filename: str, sheets: Dict[str, pd.DataFrame]):
+        """
+        Write one or more DataFrames to an Excel file in a single pass
+        
+        Args:
+            filename: Output filename
+            sheets: Mapping of sheet name to its rows
+        """
+        if HAS_XLSXWRITER:
+            # constant_memory flushes each row as it is written instead of
+            # holding the whole workbook in RAM
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
+            try:
+                for sheet_name, df in sheets.items():
+                    worksheet = workbook.add_worksheet(sheet_name)
+                    worksheet.write_row(0, 0, df.columns.tolist())
+                    for row_idx, row in enumerate(EventScraper._sheet_rows(df), 1):
+                        worksheet.write_row(row_idx, 0, row)
+            finally:
+                workbook.close()
+            return
+        
+        # openpyxl's write-only mode streams rows without building a cell tree
+        workbook = Workbook(write_only=True)
+        for sheet_name, df in sheets.items():
+            worksheet = workbook.create_sheet(title=sheet_name)
+            worksheet.append(df.columns.tolist())
+            for row in EventScraper._sheet_rows(df):
+                worksheet.append(row)
+        workbook.save(filename)
+    
+    @staticmethod
+    def _sheet_rows(df: pd.DataFrame):
+        """Yield DataFrame rows as plain Python tuples, with None for missing cells"""
+        return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
     
     def save_to_google_sheets(self, events: List[Dict], sheet_name: str = 'Pixie Events'):
         """
@@ -541,7 +874,7 @@ class EventScraper:
             except:
                 sheet = client.create(sheet_name).sheet1
             
-            df_new = pd.DataFrame(events)
+            df_new = self._events_frame(events)
             
             # Get existing data
             existing_data = sheet.get_all_records()
@@ -554,11 +887,18 @@ class EventScraper:
                 df_combined = df_new
             
             # Update status
-            df_combined['status'] = df_combined['event_date'].apply(self._determine_status)
+            df_combined['status'] = _status_series(df_combined['event_date'], datetime.now())
+            
+            # Convert to plain Python values once, blanks instead of NaN
+            rows = [df_combined.columns.values.tolist()] + \
+                df_combined.astype(object).where(df_combined.notna(), '').values.tolist()
+            
+            # Blank out any leftover rows from the previous write so the whole
+            # sheet is replaced in one request instead of clear() + update()
+            previous_rows = len(existing_data) + 1 if existing_data else 0
+            rows += [[''] * len(rows[0])] * (previous_rows - len(rows))
             
-            # Clear and update sheet
-            sheet.clear()
-            sheet.update([df_combined.columns.values.tolist()] + df_combined.values.tolist())
+            sheet.update('A1', rows, value_input_option='RAW')
             
             print(f"Updated Google Sheet with {len(df_combined)} events")
             
@@ -608,9 +948,7 @@ def main():
     
     # Create output folder if it doesn't exist
     output_dir = "output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Created output directory: {output_dir}")
+    os.makedirs(output_dir, exist_ok=True)
     
     # Save to Excel
     filename = os.path.join(output_dir, f"events_{city.lower()}_{datetime.now().strftime('%Y%m%d')}.xlsx")